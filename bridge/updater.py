@@ -2,7 +2,7 @@
 
 Provides two operations exposed via Flask endpoints:
 
-    check_for_update()  - git fetch + compare HEAD vs origin/main
+    check_for_update()  - git ls-remote/fetch + compare HEAD vs origin/main
     apply_update()      - git pull + npm run build
     schedule_restart()  - delayed os.execv (Unix) or subprocess.Popen (Windows)
 
@@ -37,29 +37,50 @@ def _run(cmd: list[str], timeout: int = 30) -> subprocess.CompletedProcess:
     )
 
 
+def _current_branch() -> str:
+    """Return the checked-out branch name (main or master), defaulting to main."""
+    result = _run(["git", "rev-parse", "--abbrev-ref", "HEAD"], timeout=5)
+    return result.stdout.strip() if result.returncode == 0 else "main"
+
+
 def check_for_update() -> dict:
-    """Fetch from origin and compare HEAD with origin/main.
+    """Compare HEAD with the tracked branch on origin.
+
+    Asks origin for the branch tip with ``git ls-remote`` first and
+    returns immediately if it matches HEAD. Only when the tips differ
+    (or ls-remote fails) does it run a full ``git fetch`` to count and
+    summarize the new commits.
 
     Returns:
         Dict with updateAvailable bool, currentCommit, latestCommit,
         and (if available) commitsBehind and summary.
     """
     try:
-        # Detect current branch name (could be main or master)
-        branch_result = _run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"], timeout=5
+        branch = _current_branch()
+
+        # Get local HEAD
+        head = _run(["git", "rev-parse", "HEAD"], timeout=5)
+        current_commit = head.stdout.strip()
+
+        # Ask origin for its branch tip first; if it matches HEAD there is
+        # nothing to download, so skip the full fetch
+        ls_remote = _run(
+            ["git", "ls-remote", "origin", f"refs/heads/{branch}"], timeout=15
         )
-        branch = branch_result.stdout.strip() if branch_result.returncode == 0 else "main"
+        if ls_remote.returncode == 0 and ls_remote.stdout.strip():
+            remote_tip = ls_remote.stdout.split()[0]
+            if remote_tip == current_commit:
+                return {
+                    "updateAvailable": False,
+                    "currentCommit": current_commit[:8],
+                    "latestCommit": remote_tip[:8],
+                }
 
         # Fetch latest refs from origin
         fetch = _run(["git", "fetch", "origin"], timeout=30)
         if fetch.returncode != 0:
             return {"updateAvailable": False, "error": fetch.stderr.strip()}
 
-        # Get local HEAD
-        head = _run(["git", "rev-parse", "HEAD"], timeout=5)
-        current_commit = head.stdout.strip()
-
         # Get remote HEAD for the tracked branch
         remote = _run(["git", "rev-parse", f"origin/{branch}"], timeout=5)
         if remote.returncode != 0:
@@ -78,17 +99,12 @@ def check_for_update() -> dict:
                 "latestCommit": latest_commit[:8],
             }
 
-        # Count commits behind
-        count = _run(
-            ["git", "rev-list", "--count", f"HEAD..origin/{branch}"], timeout=5
-        )
-        commits_behind = int(count.stdout.strip()) if count.returncode == 0 else 0
-
-        # Get one-line summaries of new commits
+        # One-line summaries of new commits; one line per commit behind
         log = _run(
             ["git", "log", "--oneline", f"HEAD..origin/{branch}"], timeout=5
         )
         summary = log.stdout.strip() if log.returncode == 0 else ""
+        commits_behind = len(summary.splitlines())
 
         return {
             "updateAvailable": True,
@@ -99,7 +115,7 @@ def check_for_update() -> dict:
         }
 
     except subprocess.TimeoutExpired:
-        return {"updateAvailable": False, "error": "Git fetch timed out"}
+        return {"updateAvailable": False, "error": "Git update check timed out"}
     except Exception as e:
         logger.error("Update check failed: %s", e)
         return {"updateAvailable": False, "error": str(e)}
@@ -117,11 +133,7 @@ def apply_update() -> dict:
         On failure, error contains the stderr output.
     """
     try:
-        # Detect current branch
-        branch_result = _run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"], timeout=5
-        )
-        branch = branch_result.stdout.strip() if branch_result.returncode == 0 else "main"
+        branch = _current_branch()
 
         # Record pre-pull SHA for rollback if build fails
         head_before = _run(["git", "rev-parse", "HEAD"], timeout=5)
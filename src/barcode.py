@@ -17,9 +17,18 @@ is displayed in the printed label text but not encoded in the barcode.
 """
 
 import logging
+import re
+from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
+from typing import Union
 
 logger = logging.getLogger(__name__)
 
+# ASCII-only digit checks. str.isdigit() and \d also accept other Unicode
+# digits (e.g. full-width or superscript), which cannot go into a barcode.
+_is_digits = re.compile(r"[0-9]+").fullmatch
+_is_12_digits = re.compile(r"[0-9]{12}").fullmatch
+_is_13_digits = re.compile(r"[0-9]{13}").fullmatch
+
 
 class BarcodeError(Exception):
     """Raised when barcode generation fails due to invalid input."""
@@ -37,17 +46,20 @@ def validate_sku(sku: str) -> str:
     Raises:
         BarcodeError: If SKU is not valid.
     """
-    if not sku.isdigit():
+    if not _is_digits(sku):
         raise BarcodeError(f"SKU must be numeric, got: '{sku}'")
     if len(sku) > 5:
         raise BarcodeError(f"SKU must be 5 digits or fewer, got: '{sku}'")
     return sku.zfill(5)
 
 
-def encode_weight(weight_lb: float) -> str:
+def encode_weight(weight_lb: Union[float, str, Decimal]) -> str:
     """Encode a weight in pounds to a 5-digit hundredths string.
 
     Multiplies weight by 100, rounds to nearest integer, zero-pads to 5 digits.
+    Ties round half to even. A str or Decimal weight (e.g. the scale's own
+    decimal reading) is rounded exactly in fixed point, so "1.015" encodes
+    as 102; the float 1.015 is stored as 1.01499... and encodes as 101.
 
     Args:
         weight_lb: Weight in pounds. Must be between 0.01 and 999.99 inclusive.
@@ -56,12 +68,23 @@ def encode_weight(weight_lb: float) -> str:
         Zero-padded 5-digit string (e.g., 1.52 -> "00152").
 
     Raises:
-        BarcodeError: If weight is out of encodable range.
+        BarcodeError: If weight is not a number or is out of encodable range.
     """
+    if isinstance(weight_lb, (str, Decimal)):
+        try:
+            weight_lb = Decimal(weight_lb)
+        except InvalidOperation:
+            raise BarcodeError(f"Weight must be a number, got: '{weight_lb}'") from None
+        if not weight_lb.is_finite():
+            raise BarcodeError(f"Weight must be a number, got: '{weight_lb}'")
+
     if weight_lb <= 0:
         raise BarcodeError(f"Weight must be positive, got: {weight_lb}")
 
-    hundredths = round(weight_lb * 100)
+    if isinstance(weight_lb, Decimal):
+        hundredths = int((weight_lb * 100).to_integral_value(rounding=ROUND_HALF_EVEN))
+    else:
+        hundredths = round(weight_lb * 100)
 
     if hundredths < 1:
         raise BarcodeError(f"Weight too small to encode: {weight_lb} lb")
@@ -73,6 +96,11 @@ def encode_weight(weight_lb: float) -> str:
     return str(hundredths).zfill(5)
 
 
+def _weight_fmt(weight_lb: Union[float, str, Decimal]) -> str:
+    """Log placeholder for a weight: 2 decimals for floats, exact text otherwise."""
+    return "%.2f" if isinstance(weight_lb, float) else "%s"
+
+
 def calculate_ean13_check_digit(digits_12: str) -> int:
     """Calculate the EAN-13 check digit for a 12-digit data string.
 
@@ -88,27 +116,28 @@ def calculate_ean13_check_digit(digits_12: str) -> int:
     Raises:
         BarcodeError: If input is not exactly 12 digits.
     """
-    if len(digits_12) != 12 or not digits_12.isdigit():
+    if not _is_12_digits(digits_12):
         raise BarcodeError(
             f"Check digit input must be exactly 12 digits, got: '{digits_12}'"
         )
 
-    total = 0
-    for i, ch in enumerate(digits_12):
-        weight = 1 if i % 2 == 0 else 3
-        total += int(ch) * weight
+    # Sum the raw ASCII bytes, then remove the "0" (48) offset of all
+    # twelve digits: 6 * 48 * 1 + 6 * 48 * 3 = 1152
+    data = digits_12.encode("ascii")
+    total = sum(data[0::2]) + 3 * sum(data[1::2]) - 1152
 
     return (10 - (total % 10)) % 10
 
 
-def generate_barcode(sku: str, weight_lb: float) -> str:
+def generate_barcode(sku: str, weight_lb: Union[float, str, Decimal]) -> str:
     """Generate a 13-digit EAN-13 barcode for an individual package label.
 
     Format: 0 + SKU(6) + weight_encoded(5) + check_digit(1)
 
     Args:
         sku: Pomponio SKU code (numeric, up to 5 digits).
-        weight_lb: Net weight in pounds.
+        weight_lb: Net weight in pounds (float, or exact str/Decimal; see
+            encode_weight).
 
     Returns:
         13-digit EAN-13 barcode string.
@@ -116,20 +145,20 @@ def generate_barcode(sku: str, weight_lb: float) -> str:
     Raises:
         BarcodeError: If SKU or weight is invalid.
     """
-    sku_5 = validate_sku(sku)
-    sku_6 = sku_5.zfill(6)
-    weight_5 = encode_weight(weight_lb)
-    data_12 = "0" + sku_6 + weight_5
-    check = calculate_ean13_check_digit(data_12)
-    barcode = data_12 + str(check)
+    # System prefix "0", then the 5-digit SKU padded to 6 with one more "0"
+    data_12 = f"00{validate_sku(sku)}{encode_weight(weight_lb)}"
+    barcode = f"{data_12}{calculate_ean13_check_digit(data_12)}"
 
     logger.debug(
-        "Generated barcode: %s (SKU=%s, weight=%.2f lb)", barcode, sku, weight_lb
+        f"Generated barcode: %s (SKU=%s, weight={_weight_fmt(weight_lb)} lb)",
+        barcode, sku, weight_lb,
     )
     return barcode
 
 
-def generate_box_barcode(sku: str, count: int, total_weight_lb: float) -> str:
+def generate_box_barcode(
+    sku: str, count: int, total_weight_lb: Union[float, str, Decimal]
+) -> str:
     """Generate a 13-digit EAN-13 barcode for a box summary label.
 
     Same format as individual labels but with aggregate weight.
@@ -140,7 +169,8 @@ def generate_box_barcode(sku: str, count: int, total_weight_lb: float) -> str:
     Args:
         sku: Pomponio SKU code (numeric, up to 5 digits).
         count: Number of pieces in the box for this SKU (not encoded in barcode).
-        total_weight_lb: Total weight in pounds for this SKU group.
+        total_weight_lb: Total weight in pounds for this SKU group (float,
+            or exact str/Decimal; see encode_weight).
 
     Returns:
         13-digit EAN-13 barcode string.
@@ -148,15 +178,13 @@ def generate_box_barcode(sku: str, count: int, total_weight_lb: float) -> str:
     Raises:
         BarcodeError: If any input is invalid.
     """
-    sku_5 = validate_sku(sku)
-    sku_6 = sku_5.zfill(6)
-    weight_5 = encode_weight(total_weight_lb)
-    data_12 = "0" + sku_6 + weight_5
-    check = calculate_ean13_check_digit(data_12)
-    barcode = data_12 + str(check)
+    # System prefix "0", then the 5-digit SKU padded to 6 with one more "0"
+    data_12 = f"00{validate_sku(sku)}{encode_weight(total_weight_lb)}"
+    barcode = f"{data_12}{calculate_ean13_check_digit(data_12)}"
 
     logger.debug(
-        "Generated box barcode: %s (SKU=%s, count=%d, weight=%.2f lb)",
+        f"Generated box barcode: %s (SKU=%s, count=%d, "
+        f"weight={_weight_fmt(total_weight_lb)} lb)",
         barcode, sku, count, total_weight_lb,
     )
     return barcode
@@ -174,7 +202,7 @@ def parse_barcode(barcode: str) -> dict:
     Raises:
         BarcodeError: If barcode is not exactly 13 digits or check digit is invalid.
     """
-    if len(barcode) != 13 or not barcode.isdigit():
+    if not _is_13_digits(barcode):
         raise BarcodeError(f"Barcode must be exactly 13 digits, got: '{barcode}'")
 
     data_12 = barcode[:12]
@@ -112,37 +112,30 @@ class AnimalScreen(ctk.CTkFrame):
         manifest_data = self._db.get_animal_manifest_data(animal["id"])
         total_weight = sum(p["weight_lb"] for p in packages)
 
-        stats_frame = ctk.CTkFrame(card, fg_color="transparent")
-        stats_frame.pack(fill="x", padx=theme.PADDING_LARGE, pady=theme.PADDING_SMALL)
-
         ctk.CTkLabel(
-            stats_frame,
+            card,
             text=f"{len(packages)} packages | {len(manifest_data)} SKUs | {total_weight:.1f} lb total",
             font=theme.FONT_BODY,
             text_color=theme.TEXT_SECONDARY,
-        ).pack(anchor="w")
+        ).pack(anchor="w", padx=theme.PADDING_LARGE, pady=theme.PADDING_SMALL)
 
-        # SKU breakdown (condensed)
+        # SKU breakdown (condensed), one line per SKU in a single label
         if manifest_data:
-            details_frame = ctk.CTkFrame(card, fg_color="transparent")
-            details_frame.pack(fill="x", padx=theme.PADDING_LARGE, pady=(0, theme.PADDING_SMALL))
-
-            for item in manifest_data[:8]:  # show first 8 SKUs
-                ctk.CTkLabel(
-                    details_frame,
-                    text=f"  {item['quantity']}x {item['product_name']} ({item['total_weight']:.1f} lb)",
-                    font=theme.FONT_SMALL,
-                    text_color=theme.TEXT_SECONDARY,
-                    anchor="w",
-                ).pack(fill="x")
-
+            lines = [
+                f"  {item['quantity']}x {item['product_name']} ({item['total_weight']:.1f} lb)"
+                for item in manifest_data[:8]  # show first 8 SKUs
+            ]
             if len(manifest_data) > 8:
-                ctk.CTkLabel(
-                    details_frame,
-                    text=f"  ... and {len(manifest_data) - 8} more SKUs",
-                    font=theme.FONT_SMALL,
-                    text_color=theme.TEXT_SECONDARY,
-                ).pack(fill="x")
+                lines.append(f"  ... and {len(manifest_data) - 8} more SKUs")
+
+            ctk.CTkLabel(
+                card,
+                text="\n".join(lines),
+                font=theme.FONT_SMALL,
+                text_color=theme.TEXT_SECONDARY,
+                anchor="w",
+                justify="left",
+            ).pack(fill="x", padx=theme.PADDING_LARGE, pady=(0, theme.PADDING_SMALL))
 
         # Action buttons
         btn_frame = ctk.CTkFrame(card, fg_color="transparent")
@@ -229,7 +222,7 @@ class AnimalScreen(ctk.CTkFrame):
         packages = self._db.get_packages_for_animal(animal_id)
         msg = f"Close '{name}'?\n{len(packages)} packages will be finalized."
 
-        ConfirmDialog(
+        ConfirmDialog.show(
             self,
             title="Close Animal",
             message=msg,
@@ -7,6 +7,7 @@ Coordinates database, hardware, and UI modules.
 import logging
 import os
 import sys
+import threading
 from typing import Optional
 
 import customtkinter as ctk
@@ -27,6 +28,10 @@ from src.ui.animals import AnimalScreen
 
 logger = logging.getLogger(__name__)
 
+# Gap between building deferred screens once the window is mapped. Lets the
+# labeling screen paint first and keeps taps responsive between builds.
+DEFERRED_SCREEN_DELAY_MS = 100
+
 
 class App(ctk.CTk):
     """Main application window."""
@@ -61,6 +66,11 @@ class App(ctk.CTk):
         self._current_animal_id: Optional[int] = None
         self._current_box_id: Optional[int] = None
 
+        # Latest scale reading awaiting delivery to the UI thread
+        self._reading_lock = threading.Lock()
+        self._pending_reading: Optional[ScaleReading] = None
+        self._reading_scheduled = False
+
         # Build UI
         self._build_ui()
 
@@ -141,15 +151,10 @@ class App(ctk.CTk):
         self._info_bar = InfoBar(self)
         self._info_bar.pack(fill="x", side="bottom")
 
-        # Build screens (lazy, only the visible one is packed)
-        products = self._db.get_all_active_products()
-
-        self._product_grid = ProductGrid(
-            self._content_frame,
-            products=products,
-            on_select=self._on_product_selected,
-        )
-
+        # Build screens. Only the labeling screen is needed for the first
+        # paint; the others are built at idle (or on first use, whichever
+        # comes first) so their widget trees and DB queries stay off the
+        # startup path.
         self._labeling_screen = LabelingScreen(
             self._content_frame,
             workflow=self._workflow,
@@ -158,56 +163,92 @@ class App(ctk.CTk):
             on_package_complete=self._on_package_complete,
         )
 
-        self._box_screen = BoxScreen(
+        self._screens: dict[str, ctk.CTkFrame] = {"Label": self._labeling_screen}
+        self._screen_builders = {
+            "Products": self._build_product_grid,
+            "Boxes": self._build_box_screen,
+            "Animals": self._build_animal_screen,
+        }
+        self._current_screen: Optional[str] = None
+
+        # Show labeling screen by default
+        self._show_labeling()
+
+        # Build the other screens only after the window is on screen
+        self._deferred_build_started = False
+        self.bind("<Map>", self._on_first_map, add="+")
+
+    def _build_product_grid(self) -> ProductGrid:
+        return ProductGrid(
+            self._content_frame,
+            products=self._db.get_all_active_products(),
+            on_select=self._on_product_selected,
+        )
+
+    def _build_box_screen(self) -> BoxScreen:
+        return BoxScreen(
             self._content_frame,
             db=self._db,
             current_animal_id=self._current_animal_id,
             on_close_box=self._on_close_box,
         )
 
-        self._animal_screen = AnimalScreen(
+    def _build_animal_screen(self) -> AnimalScreen:
+        return AnimalScreen(
             self._content_frame,
             db=self._db,
             on_animal_changed=self._on_animal_changed,
             on_generate_manifest=self._on_generate_manifest,
         )
 
-        self._screens = {
-            "Label": self._labeling_screen,
-            "Products": self._product_grid,
-            "Boxes": self._box_screen,
-            "Animals": self._animal_screen,
-        }
-        self._current_screen: Optional[str] = None
+    def _get_screen(self, name: str) -> ctk.CTkFrame:
+        """Return the named screen, building it on first access."""
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = self._screen_builders[name]()
+            self._screens[name] = screen
+        return screen
+
+    def _on_first_map(self, event) -> None:
+        """Start building deferred screens the first time the window maps."""
+        # Child widgets' <Map> events also reach the root's bindings
+        if event.widget is not self or self._deferred_build_started:
+            return
+        self._deferred_build_started = True
+        self.after(DEFERRED_SCREEN_DELAY_MS, self._build_next_deferred_screen)
 
-        # Show labeling screen by default
-        self._show_labeling()
+    def _build_next_deferred_screen(self) -> None:
+        """Build one screen not yet created, then schedule the next."""
+        for name in self._screen_builders:
+            if name not in self._screens:
+                self._get_screen(name)
+                self.after(DEFERRED_SCREEN_DELAY_MS, self._build_next_deferred_screen)
+                return
 
     def _show_screen(self, name: str) -> None:
         """Switch to the named screen."""
-        if self._current_screen == name:
+        previous = self._current_screen
+        if previous == name:
             return
 
         # Hide current
-        for screen in self._screens.values():
-            screen.pack_forget()
+        if previous is not None:
+            self._screens[previous].pack_forget()
 
         # Show target
-        self._screens[name].pack(fill="both", expand=True)
+        self._get_screen(name).pack(fill="both", expand=True)
         self._current_screen = name
 
-        # Update nav styling
-        for tab_name, btn in self._tab_buttons.items():
-            if tab_name == name:
-                btn.configure(
-                    fg_color=theme.BTN_PRIMARY_BG,
-                    text_color=theme.TEXT_PRIMARY,
-                )
-            else:
-                btn.configure(
-                    fg_color=theme.BG_TERTIARY,
-                    text_color=theme.TEXT_SECONDARY,
-                )
+        # Update nav styling; only the old and new tabs change
+        if previous is not None:
+            self._tab_buttons[previous].configure(
+                fg_color=theme.BG_TERTIARY,
+                text_color=theme.TEXT_SECONDARY,
+            )
+        self._tab_buttons[name].configure(
+            fg_color=theme.BTN_PRIMARY_BG,
+            text_color=theme.TEXT_PRIMARY,
+        )
 
     def _show_labeling(self) -> None:
         self._show_screen("Label")
@@ -216,13 +257,19 @@ class App(ctk.CTk):
         self._show_screen("Products")
 
     def _show_boxes(self) -> None:
-        self._box_screen.refresh()
+        self._refresh_if_built("Boxes")
         self._show_screen("Boxes")
 
     def _show_animals(self) -> None:
-        self._animal_screen.refresh()
+        self._refresh_if_built("Animals")
         self._show_screen("Animals")
 
+    def _refresh_if_built(self, name: str) -> None:
+        """Reload an already-built screen. New screens load on construction."""
+        screen = self._screens.get(name)
+        if screen is not None:
+            screen.refresh()
+
     # --- Hardware ---
 
     def _try_connect_hardware(self) -> None:
@@ -264,10 +311,27 @@ class App(ctk.CTk):
         self._labeling_screen.set_product(product)
 
     def _on_scale_weight(self, reading: ScaleReading) -> None:
-        """Handle live weight reading from scale (called from background thread)."""
-        self.after(0, lambda: self._labeling_screen.update_weight(
-            reading.weight_lb, reading.stable
-        ))
+        """Handle live weight reading from scale (called from background thread).
+
+        Only the newest reading matters, so readings that arrive while a
+        UI update is already queued replace the pending one instead of
+        queueing another Tk callback.
+        """
+        with self._reading_lock:
+            self._pending_reading = reading
+            if self._reading_scheduled:
+                return
+            self._reading_scheduled = True
+        self.after(0, self._flush_scale_reading)
+
+    def _flush_scale_reading(self) -> None:
+        """Deliver the latest pending scale reading on the UI thread."""
+        with self._reading_lock:
+            reading = self._pending_reading
+            self._pending_reading = None
+            self._reading_scheduled = False
+        if reading is not None:
+            self._labeling_screen.update_weight(reading.weight_lb, reading.stable)
 
     def _on_scale_lock(self, weight: float) -> None:
         """Handle locked weight from scale (called from background thread)."""
@@ -341,7 +405,9 @@ class App(ctk.CTk):
     def _on_animal_changed(self, animal_id: Optional[int]) -> None:
         """Handle active animal change."""
         self._current_animal_id = animal_id
-        self._box_screen.set_animal_id(animal_id)
+        box_screen = self._screens.get("Boxes")
+        if box_screen is not None:
+            box_screen.set_animal_id(animal_id)
 
         if animal_id is not None:
             # Auto-create first box if none exist
@@ -125,19 +125,19 @@ class BoxScreen(ctk.CTkFrame):
             text_color=theme.TEXT_SECONDARY,
         ).pack(side="right")
 
-        # SKU breakdown
+        # SKU breakdown, one line per SKU in a single label
         if summary:
-            details_frame = ctk.CTkFrame(card, fg_color="transparent")
-            details_frame.pack(fill="x", padx=theme.PADDING_LARGE, pady=theme.PADDING_SMALL)
-
-            for item in summary:
-                ctk.CTkLabel(
-                    details_frame,
-                    text=f"  {item['quantity']}x {item['product_name']} ({item['total_weight']:.1f} lb)",
-                    font=theme.FONT_SMALL,
-                    text_color=theme.TEXT_SECONDARY,
-                    anchor="w",
-                ).pack(fill="x")
+            ctk.CTkLabel(
+                card,
+                text="\n".join(
+                    f"  {item['quantity']}x {item['product_name']} ({item['total_weight']:.1f} lb)"
+                    for item in summary
+                ),
+                font=theme.FONT_SMALL,
+                text_color=theme.TEXT_SECONDARY,
+                anchor="w",
+                justify="left",
+            ).pack(fill="x", padx=theme.PADDING_LARGE, pady=theme.PADDING_SMALL)
 
         # Close box button
         TouchButton(
@@ -163,7 +163,7 @@ class BoxScreen(ctk.CTkFrame):
         box = self._db.get_box(box_id)
         msg = f"Close Box {box['box_number']}?\n{total} packages inside."
 
-        ConfirmDialog(
+        ConfirmDialog.show(
             self,
             title="Close Box",
             message=msg,
@@ -52,6 +52,10 @@ class LabelingScreen(ctk.CTkFrame):
         self._on_print_request = on_print_request
         self._on_package_complete = on_package_complete
 
+        # Bumped whenever the display is reset, so a pending auto-finish
+        # timer from an earlier cycle knows it is stale and does nothing.
+        self._cycle_gen = 0
+
         self._build_ui()
         self._update_for_state()
 
@@ -156,9 +160,7 @@ class LabelingScreen(ctk.CTkFrame):
 
         self._product_name_label.configure(text=product["name"])
         self._sku_label.configure(text=f"SKU: {product['sku']}")
-        self._weight_display.reset()
-        self._barcode_label.configure(text="")
-        self._scan_result_label.configure(text="")
+        self._clear_readouts()
         self._update_for_state()
 
     def update_weight(self, weight: float, stable: bool) -> None:
@@ -230,21 +232,13 @@ class LabelingScreen(ctk.CTkFrame):
             logger.warning("Cannot re-weigh: %s", e)
             return
 
-        self._weight_display.reset()
-        self._barcode_label.configure(text="")
-        self._scan_result_label.configure(text="")
+        self._clear_readouts()
         self._update_for_state()
 
     def _do_cancel(self) -> None:
         """Handle Cancel button."""
         self._workflow.cancel()
-        self._scanner.clear_expected()
-        self._product_name_label.configure(text="Select a product")
-        self._sku_label.configure(text="")
-        self._weight_display.reset()
-        self._barcode_label.configure(text="")
-        self._scan_result_label.configure(text="")
-        self._update_for_state()
+        self._reset_display()
 
     def _on_scan_entry(self, event=None) -> None:
         """Handle Enter key in the hidden scan entry (keyboard wedge)."""
@@ -278,7 +272,8 @@ class LabelingScreen(ctk.CTkFrame):
                 })
 
             # Auto-return to idle after brief delay
-            self.after(1500, self._finish_cycle)
+            gen = self._cycle_gen
+            self.after(1500, lambda: self._finish_cycle(gen))
         else:
             self._scan_result_label.configure(
                 text=f"MISMATCH\nScanned: {result.scanned}\nExpected: {result.expected}",
@@ -289,19 +284,35 @@ class LabelingScreen(ctk.CTkFrame):
                 result.scanned, result.expected,
             )
 
-    def _finish_cycle(self) -> None:
-        """Complete the workflow cycle and return to idle."""
+    def _finish_cycle(self, gen: int) -> None:
+        """Complete the workflow cycle and return to idle.
+
+        Ignored if the display was reset (e.g. by Cancel) after the
+        timer for cycle ``gen`` was scheduled.
+        """
+        if gen != self._cycle_gen:
+            return
+
         try:
             self._workflow.complete()
         except WorkflowError:
             self._workflow.cancel()
 
-        self._scanner.clear_expected()
-        self._product_name_label.configure(text="Select a product")
-        self._sku_label.configure(text="")
+        self._reset_display()
+
+    def _clear_readouts(self) -> None:
+        """Clear the weight, barcode, and scan result readouts."""
         self._weight_display.reset()
         self._barcode_label.configure(text="")
         self._scan_result_label.configure(text="")
+
+    def _reset_display(self) -> None:
+        """Return the screen to the no-product state after a cycle ends."""
+        self._cycle_gen += 1
+        self._scanner.clear_expected()
+        self._product_name_label.configure(text="Select a product")
+        self._sku_label.configure(text="")
+        self._clear_readouts()
         self._update_for_state()
 
     def _update_for_state(self) -> None:
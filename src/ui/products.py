@@ -42,6 +42,11 @@ class ProductGrid(ctk.CTkFrame):
         self._products = products
         self._on_select = on_select
         self._current_category = CATEGORY_ORDER[0]
+        self._highlighted_tab: Optional[str] = None
+
+        # One grid page per category, built the first time it is shown
+        self._pages: dict[str, ctk.CTkFrame] = {}
+        self._visible_page: Optional[ctk.CTkFrame] = None
 
         # Classify products into UI categories
         self._categorized: dict[str, list[dict]] = {cat: [] for cat in CATEGORY_ORDER}
@@ -86,33 +91,43 @@ class ProductGrid(ctk.CTkFrame):
         )
         self._scroll_frame.pack(fill="both", expand=True, padx=theme.PADDING_SMALL, pady=theme.PADDING_SMALL)
 
-        # Configure grid columns
-        for col in range(theme.PRODUCT_GRID_COLUMNS):
-            self._scroll_frame.columnconfigure(col, weight=1)
-
     def _show_category(self, category: str) -> None:
         """Display products for the selected category."""
         self._current_category = category
 
-        # Update tab styling
-        for cat, btn in self._tab_buttons.items():
-            if cat == category:
-                colors = CATEGORY_COLORS.get(cat, CATEGORY_COLORS["Steaks"])
-                btn.configure(
-                    fg_color=colors["bg"],
-                    text_color=theme.TEXT_PRIMARY,
-                )
-            else:
-                btn.configure(
+        # Update tab styling; only the old and new tabs change
+        previous = self._highlighted_tab
+        if previous != category:
+            if previous is not None:
+                self._tab_buttons[previous].configure(
                     fg_color=theme.BG_TERTIARY,
                     text_color=theme.TEXT_SECONDARY,
                 )
+            colors = CATEGORY_COLORS.get(category, CATEGORY_COLORS["Steaks"])
+            self._tab_buttons[category].configure(
+                fg_color=colors["bg"],
+                text_color=theme.TEXT_PRIMARY,
+            )
+            self._highlighted_tab = category
+
+        # Swap in the category's page, building it on first view
+        page = self._pages.get(category)
+        if page is None:
+            page = self._build_page(category)
+            self._pages[category] = page
+
+        if page is not self._visible_page:
+            if self._visible_page is not None:
+                self._visible_page.pack_forget()
+            page.pack(fill="both", expand=True)
+            self._visible_page = page
+
+    def _build_page(self, category: str) -> ctk.CTkFrame:
+        """Build the product button grid for one category."""
+        page = ctk.CTkFrame(self._scroll_frame, fg_color="transparent")
+        for col in range(theme.PRODUCT_GRID_COLUMNS):
+            page.columnconfigure(col, weight=1)
 
-        # Clear existing grid
-        for widget in self._scroll_frame.winfo_children():
-            widget.destroy()
-
-        # Populate grid
         products = self._categorized.get(category, [])
         colors = get_category_color(category)
 
@@ -121,7 +136,7 @@ class ProductGrid(ctk.CTkFrame):
             col = i % theme.PRODUCT_GRID_COLUMNS
 
             btn = ProductButton(
-                self._scroll_frame,
+                page,
                 product_name=product["name"],
                 sku=product["sku"],
                 category_color=colors,
@@ -134,6 +149,8 @@ class ProductGrid(ctk.CTkFrame):
                 sticky="nsew",
             )
 
+        return page
+
     def _select_product(self, product: dict) -> None:
         """Handle product selection."""
         logger.info("Product selected: %s (%s)", product["name"], product["sku"])
@@ -154,4 +171,10 @@ class ProductGrid(ctk.CTkFrame):
             count = len(self._categorized[cat])
             btn.configure(text=f"{cat}\n({count})")
 
+        # Drop cached pages; they are rebuilt from the new data on demand
+        for page in self._pages.values():
+            page.destroy()
+        self._pages.clear()
+        self._visible_page = None
+
         self._show_category(self._current_category)
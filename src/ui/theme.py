@@ -52,6 +52,11 @@ CATEGORY_COLORS = {
     "Sausage/Processed": {"bg": "#2a1a2a", "hover": "#3a2a3a", "accent": "#c090d4"},
 }
 
+# Map database categories to UI groups
+CATEGORY_MAP = {
+    "Beef": "Steaks",  # default; overridden per subcategory by classify_product
+}
+
 # Workflow state colors
 STATE_COLORS = {
     "idle": TEXT_SECONDARY,
@@ -92,6 +97,10 @@ TAB_HEIGHT = 60              # category tab bar height
 # Product grid
 PRODUCT_GRID_COLUMNS = 3     # columns in product grid (17" screen)
 PRODUCT_BUTTON_HEIGHT = 90   # height of each product button
+# Hover highlight on product buttons. Off for the touchscreen: there is no
+# pointer to hover, a tap leaves the last-touched button stuck highlighted,
+# and each enter/leave redraws the button canvas.
+PRODUCT_HOVER_FEEDBACK = False
 
 
 def get_category_color(category_name: str) -> dict:
@@ -99,11 +108,6 @@ def get_category_color(category_name: str) -> dict:
 
     Maps product categories from the database to UI color groups.
     """
-    # Map database categories to UI groups
-    CATEGORY_MAP = {
-        "Beef": "Steaks",  # default; overridden per subcategory below
-    }
-
     # Try direct match first, then mapped, then default
     if category_name in CATEGORY_COLORS:
         return CATEGORY_COLORS[category_name]
@@ -9,6 +9,28 @@ from typing import Callable, Optional
 
 from src.ui import theme
 
+# TouchButton style name -> (fg_color, hover_color, text_color)
+_TOUCHBUTTON_STYLES = {
+    "primary": (theme.BTN_PRIMARY_BG, theme.BTN_PRIMARY_HOVER, theme.BTN_PRIMARY_TEXT),
+    "success": (theme.BTN_SUCCESS_BG, theme.BTN_SUCCESS_HOVER, theme.BTN_SUCCESS_TEXT),
+    "danger": (theme.BTN_DANGER_BG, theme.BTN_DANGER_HOVER, theme.BTN_DANGER_TEXT),
+    "secondary": (theme.BTN_SECONDARY_BG, theme.BTN_SECONDARY_HOVER, theme.BTN_SECONDARY_TEXT),
+}
+
+# (product_name, sku) -> ProductButton label text
+_PRODUCT_TEXT_CACHE: dict[tuple[str, str], str] = {}
+
+
+def _product_button_text(product_name: str, sku: str) -> str:
+    """Two-line product button label, with long names truncated."""
+    key = (product_name, sku)
+    text = _PRODUCT_TEXT_CACHE.get(key)
+    if text is None:
+        display_name = product_name if len(product_name) <= 28 else product_name[:26] + ".."
+        text = f"{display_name}\n{sku}"
+        _PRODUCT_TEXT_CACHE[key] = text
+    return text
+
 
 class TouchButton(ctk.CTkButton):
     """Large touch-friendly button meeting 80px minimum height."""
@@ -23,13 +45,9 @@ class TouchButton(ctk.CTkButton):
         font: Optional[tuple] = None,
         **kwargs,
     ):
-        style_map = {
-            "primary": (theme.BTN_PRIMARY_BG, theme.BTN_PRIMARY_HOVER, theme.BTN_PRIMARY_TEXT),
-            "success": (theme.BTN_SUCCESS_BG, theme.BTN_SUCCESS_HOVER, theme.BTN_SUCCESS_TEXT),
-            "danger": (theme.BTN_DANGER_BG, theme.BTN_DANGER_HOVER, theme.BTN_DANGER_TEXT),
-            "secondary": (theme.BTN_SECONDARY_BG, theme.BTN_SECONDARY_HOVER, theme.BTN_SECONDARY_TEXT),
-        }
-        bg, hover, text_color = style_map.get(style, style_map["primary"])
+        bg, hover, text_color = _TOUCHBUTTON_STYLES.get(
+            style, _TOUCHBUTTON_STYLES["primary"]
+        )
 
         super().__init__(
             master,
@@ -60,17 +78,15 @@ class ProductButton(ctk.CTkButton):
         self._product_name = product_name
         self._sku = sku
 
-        # Truncate long names for display
-        display_name = product_name if len(product_name) <= 28 else product_name[:26] + ".."
-
         super().__init__(
             master,
-            text=f"{display_name}\n{sku}",
+            text=_product_button_text(product_name, sku),
             command=command,
             height=theme.PRODUCT_BUTTON_HEIGHT,
             font=theme.FONT_BODY,
             fg_color=category_color.get("bg", theme.BTN_PRIMARY_BG),
             hover_color=category_color.get("hover", theme.BTN_PRIMARY_HOVER),
+            hover=theme.PRODUCT_HOVER_FEEDBACK,
             text_color=theme.TEXT_PRIMARY,
             corner_radius=theme.BUTTON_CORNER_RADIUS,
             anchor="w",
@@ -84,9 +100,10 @@ class WeightDisplay(ctk.CTkFrame):
     def __init__(self, master, **kwargs):
         super().__init__(master, fg_color=theme.BG_SECONDARY, **kwargs)
 
+        self._weight_var = ctk.StringVar(value="0.000")
         self._weight_label = ctk.CTkLabel(
             self,
-            text="0.000",
+            textvariable=self._weight_var,
             font=theme.FONT_WEIGHT_DISPLAY,
             text_color=theme.TEXT_PRIMARY,
         )
@@ -108,35 +125,53 @@ class WeightDisplay(ctk.CTkFrame):
         )
         self._status_label.pack(pady=(0, theme.PADDING_MEDIUM))
 
+        # Last values pushed to the labels, so repeated identical scale
+        # readings do not reconfigure them. set_locked and reset set
+        # _shown_stable to None to force the next status rewrite.
+        self._shown_weight: str = "0.000"
+        self._shown_stable: Optional[bool] = None
+
     def set_weight(self, weight: float, stable: bool = False) -> None:
         """Update the displayed weight."""
-        self._weight_label.configure(text=f"{weight:.3f}")
-        if stable:
-            self._status_label.configure(
-                text="STABLE", text_color=theme.TEXT_SUCCESS
-            )
-        else:
-            self._status_label.configure(
-                text="Stabilizing...", text_color=theme.TEXT_WARNING
-            )
+        text = f"{weight:.3f}"
+        if text == self._shown_weight and stable == self._shown_stable:
+            return
+
+        if text != self._shown_weight:
+            self._weight_var.set(text)
+            self._shown_weight = text
+
+        if stable != self._shown_stable:
+            if stable:
+                self._status_label.configure(
+                    text="STABLE", text_color=theme.TEXT_SUCCESS
+                )
+            else:
+                self._status_label.configure(
+                    text="Stabilizing...", text_color=theme.TEXT_WARNING
+                )
+            self._shown_stable = stable
 
     def set_locked(self, weight: float) -> None:
         """Show locked weight with visual confirmation."""
-        self._weight_label.configure(
-            text=f"{weight:.3f}", text_color=theme.TEXT_SUCCESS
-        )
+        text = f"{weight:.3f}"
+        self._weight_var.set(text)
+        self._weight_label.configure(text_color=theme.TEXT_SUCCESS)
         self._status_label.configure(
             text="LOCKED", text_color=theme.TEXT_SUCCESS
         )
+        self._shown_weight = text
+        self._shown_stable = None
 
     def reset(self) -> None:
         """Reset to default state."""
-        self._weight_label.configure(
-            text="0.000", text_color=theme.TEXT_PRIMARY
-        )
+        self._weight_var.set("0.000")
+        self._weight_label.configure(text_color=theme.TEXT_PRIMARY)
         self._status_label.configure(
             text="Place item on scale", text_color=theme.TEXT_SECONDARY
         )
+        self._shown_weight = "0.000"
+        self._shown_stable = None
 
 
 class StatusIndicator(ctk.CTkFrame):
@@ -149,13 +184,15 @@ class StatusIndicator(ctk.CTkFrame):
         ("Scan", "awaiting_scan"),
         ("Done", "verified"),
     ]
+    _STATE_INDEX = {state_key: i for i, (_, state_key) in enumerate(STATES)}
 
     def __init__(self, master, **kwargs):
         super().__init__(master, fg_color=theme.BG_SECONDARY, **kwargs)
 
         self._indicators: list[ctk.CTkLabel] = []
 
-        for label_text, state_key in self.STATES:
+        for column, (label_text, state_key) in enumerate(self.STATES):
+            self.columnconfigure(column, uniform="step")
             indicator = ctk.CTkLabel(
                 self,
                 text=label_text,
@@ -166,34 +203,48 @@ class StatusIndicator(ctk.CTkFrame):
                 width=100,
                 height=40,
             )
-            indicator.pack(side="left", padx=4, pady=8)
+            indicator.grid(row=0, column=column, padx=4, pady=8)
             self._indicators.append(indicator)
 
+        # configure() kwargs for each indicator in each role, resolved once
+        self._styles: list[dict[str, dict[str, str]]] = [
+            {
+                "done": {"text_color": theme.TEXT_SUCCESS, "fg_color": theme.BG_TERTIARY},
+                "active": {
+                    "text_color": theme.STATE_COLORS.get(state_key, theme.TEXT_ACCENT),
+                    "fg_color": theme.BG_PRIMARY,
+                },
+                "idle": {"text_color": theme.TEXT_SECONDARY, "fg_color": theme.BG_TERTIARY},
+            }
+            for _, state_key in self.STATES
+        ]
+        # Role currently shown by each indicator
+        self._roles: list[str] = ["idle"] * len(self._indicators)
+
     def set_state(self, current_state: str) -> None:
         """Highlight the current workflow state."""
-        state_keys = [s[1] for s in self.STATES]
-
-        for i, (label_text, state_key) in enumerate(self.STATES):
-            if state_key == current_state:
-                color = theme.STATE_COLORS.get(state_key, theme.TEXT_ACCENT)
-                self._indicators[i].configure(
-                    text_color=color, fg_color=theme.BG_PRIMARY
-                )
-            elif state_keys.index(state_key) < state_keys.index(current_state) if current_state in state_keys else False:
-                self._indicators[i].configure(
-                    text_color=theme.TEXT_SUCCESS, fg_color=theme.BG_TERTIARY
-                )
-            else:
-                self._indicators[i].configure(
-                    text_color=theme.TEXT_SECONDARY, fg_color=theme.BG_TERTIARY
-                )
+        index = self._STATE_INDEX.get(current_state)
+        if index is None:
+            self.reset()
+            return
+
+        # Completed steps, then the active step, then pending steps
+        for i in range(index):
+            self._apply(i, "done")
+        self._apply(index, "active")
+        for i in range(index + 1, len(self._indicators)):
+            self._apply(i, "idle")
 
     def reset(self) -> None:
         """Reset all indicators to default."""
-        for indicator in self._indicators:
-            indicator.configure(
-                text_color=theme.TEXT_SECONDARY, fg_color=theme.BG_TERTIARY
-            )
+        for i in range(len(self._indicators)):
+            self._apply(i, "idle")
+
+    def _apply(self, i: int, role: str) -> None:
+        """Show indicator ``i`` in ``role``, skipping the configure if unchanged."""
+        if self._roles[i] != role:
+            self._indicators[i].configure(**self._styles[i][role])
+            self._roles[i] = role
 
 
 class InfoBar(ctk.CTkFrame):
@@ -203,46 +254,77 @@ class InfoBar(ctk.CTkFrame):
         super().__init__(master, fg_color=theme.BG_TERTIARY, height=50, **kwargs)
         self.pack_propagate(False)
 
+        self._animal_var = ctk.StringVar(value="No animal")
         self._animal_label = ctk.CTkLabel(
-            self, text="No animal", font=theme.FONT_BODY,
+            self, textvariable=self._animal_var, font=theme.FONT_BODY,
             text_color=theme.TEXT_SECONDARY,
         )
         self._animal_label.pack(side="left", padx=theme.PADDING_MEDIUM)
 
+        self._box_var = ctk.StringVar(value="No box")
         self._box_label = ctk.CTkLabel(
-            self, text="No box", font=theme.FONT_BODY,
+            self, textvariable=self._box_var, font=theme.FONT_BODY,
             text_color=theme.TEXT_SECONDARY,
         )
         self._box_label.pack(side="left", padx=theme.PADDING_MEDIUM)
 
+        self._count_var = ctk.StringVar(value="0 packages")
         self._count_label = ctk.CTkLabel(
-            self, text="0 packages", font=theme.FONT_BODY,
+            self, textvariable=self._count_var, font=theme.FONT_BODY,
             text_color=theme.TEXT_SECONDARY,
         )
         self._count_label.pack(side="right", padx=theme.PADDING_MEDIUM)
 
+        self._shown_info: Optional[tuple] = None
+
     def update_info(
         self,
         animal_name: Optional[str] = None,
         box_number: Optional[int] = None,
         package_count: int = 0,
     ) -> None:
-        self._animal_label.configure(
-            text=animal_name or "No animal",
-            text_color=theme.TEXT_PRIMARY if animal_name else theme.TEXT_SECONDARY,
+        info = (animal_name, box_number, package_count)
+        if info == self._shown_info:
+            return
+        self._shown_info = info
+
+        self._show(
+            self._animal_label, self._animal_var,
+            animal_name or "No animal",
+            theme.TEXT_PRIMARY if animal_name else theme.TEXT_SECONDARY,
         )
-        self._box_label.configure(
-            text=f"Box {box_number}" if box_number else "No box",
-            text_color=theme.TEXT_PRIMARY if box_number else theme.TEXT_SECONDARY,
+        self._show(
+            self._box_label, self._box_var,
+            f"Box {box_number}" if box_number else "No box",
+            theme.TEXT_PRIMARY if box_number else theme.TEXT_SECONDARY,
         )
-        self._count_label.configure(
-            text=f"{package_count} package{'s' if package_count != 1 else ''}",
-            text_color=theme.TEXT_PRIMARY,
+        self._show(
+            self._count_label, self._count_var,
+            f"{package_count} package{'s' if package_count != 1 else ''}",
+            theme.TEXT_PRIMARY,
         )
 
+    @staticmethod
+    def _show(label: ctk.CTkLabel, var: ctk.StringVar, text: str, color: str) -> None:
+        """Set a label's text through its variable; configure only a color change."""
+        if var.get() != text:
+            var.set(text)
+        if label.cget("text_color") != color:
+            label.configure(text_color=color)
+
+
+# Reusable confirmation dialogs, keyed by (master, confirm_text, cancel_text)
+_dialog_pool: dict[tuple, "ConfirmDialog"] = {}
+
 
 class ConfirmDialog(ctk.CTkToplevel):
-    """Modal confirmation dialog with large touch targets."""
+    """Modal confirmation dialog with large touch targets.
+
+    Prefer ConfirmDialog.show() over the constructor: pooled dialogs are
+    hidden instead of destroyed when answered and reused for the next
+    confirmation with the same master and button labels. A dialog built
+    directly with the constructor is destroyed when answered.
+    """
 
     def __init__(
         self,
@@ -259,16 +341,19 @@ class ConfirmDialog(ctk.CTkToplevel):
         self.geometry("500x300")
         self.configure(fg_color=theme.BG_PRIMARY)
         self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self._do_cancel)
         self.grab_set()
 
         self._on_confirm = on_confirm
         self._on_cancel = on_cancel
+        # Set by show(); only pooled dialogs survive being answered
+        self._pooled = False
 
-        msg_label = ctk.CTkLabel(
+        self._msg_label = ctk.CTkLabel(
             self, text=message, font=theme.FONT_HEADING,
             text_color=theme.TEXT_PRIMARY, wraplength=440,
         )
-        msg_label.pack(pady=(theme.PADDING_LARGE * 2, theme.PADDING_LARGE))
+        self._msg_label.pack(pady=(theme.PADDING_LARGE * 2, theme.PADDING_LARGE))
 
         btn_frame = ctk.CTkFrame(self, fg_color="transparent")
         btn_frame.pack(fill="x", padx=theme.PADDING_LARGE, pady=theme.PADDING_MEDIUM)
@@ -283,12 +368,65 @@ class ConfirmDialog(ctk.CTkToplevel):
             command=self._do_confirm, width=200,
         ).pack(side="right", padx=theme.PADDING_SMALL)
 
+    @classmethod
+    def show(
+        cls,
+        master,
+        title: str = "Confirm",
+        message: str = "Are you sure?",
+        confirm_text: str = "Yes",
+        cancel_text: str = "No",
+        on_confirm: Optional[Callable] = None,
+        on_cancel: Optional[Callable] = None,
+    ) -> "ConfirmDialog":
+        """Show a confirmation dialog, reusing a pooled one when possible."""
+        key = (master, confirm_text, cancel_text)
+        dialog = _dialog_pool.get(key)
+        if dialog is None or not dialog.winfo_exists():
+            dialog = cls(
+                master, title, message, confirm_text, cancel_text,
+                on_confirm, on_cancel,
+            )
+            dialog._pooled = True
+            _dialog_pool[key] = dialog
+        else:
+            dialog._reopen(title, message, on_confirm, on_cancel)
+        return dialog
+
+    def _reopen(
+        self,
+        title: str,
+        message: str,
+        on_confirm: Optional[Callable],
+        on_cancel: Optional[Callable],
+    ) -> None:
+        """Update texts and callbacks on a pooled dialog and show it again."""
+        self._on_confirm = on_confirm
+        self._on_cancel = on_cancel
+        self.title(title)
+        self._msg_label.configure(text=message)
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+
+    def _close(self) -> None:
+        """Hide a pooled dialog for reuse, or destroy an unpooled one."""
+        self.grab_release()
+        self._on_confirm = None
+        self._on_cancel = None
+        if self._pooled:
+            self.withdraw()
+        else:
+            self.destroy()
+
     def _do_confirm(self) -> None:
-        if self._on_confirm:
-            self._on_confirm()
-        self.destroy()
+        callback = self._on_confirm
+        self._close()
+        if callback:
+            callback()
 
     def _do_cancel(self) -> None:
-        if self._on_cancel:
-            self._on_cancel()
-        self.destroy()
+        callback = self._on_cancel
+        self._close()
+        if callback:
+            callback()
@@ -12,7 +12,11 @@ Tests cover:
 """
 
 import csv
+import functools
+import logging
 import os
+from decimal import Decimal
+
 import pytest
 
 from src.barcode import (
@@ -30,6 +34,37 @@ from src.barcode import (
 # EAN-13 check digit calculation
 # ---------------------------------------------------------------------------
 
+# Weighted contribution (1*d1 + 3*d2) of every two-digit pair, indexed by 10*d1 + d2
+_PAIR_CONTRIB = tuple(d1 + 3 * d2 for d1 in range(10) for d2 in range(10))
+
+# ASCII byte -> digit value; only "0"-"9" are ever looked up
+_DIGIT_VALUE = [b - 48 if 48 <= b <= 57 else 0 for b in range(256)]
+
+
+def _oracle_check_digit(digits_12):
+    """Independent check digit implementation: six pair-table lookups."""
+    b = digits_12.encode("ascii")
+    v = _DIGIT_VALUE
+    total = (
+        _PAIR_CONTRIB[10 * v[b[0]] + v[b[1]]]
+        + _PAIR_CONTRIB[10 * v[b[2]] + v[b[3]]]
+        + _PAIR_CONTRIB[10 * v[b[4]] + v[b[5]]]
+        + _PAIR_CONTRIB[10 * v[b[6]] + v[b[7]]]
+        + _PAIR_CONTRIB[10 * v[b[8]] + v[b[9]]]
+        + _PAIR_CONTRIB[10 * v[b[10]] + v[b[11]]]
+    )
+    return (10 - total % 10) % 10
+
+
+CHECK_DIGIT_ERRORS = [
+    "00001010008",    # 11 digits
+    "0000101000850",  # 13 digits
+    "00001010008A",   # non-digit
+    "",
+    "\u0660" * 12,     # Arabic-Indic digits pass str.isdigit()
+]
+
+
 class TestCheckDigit:
     """Test the EAN-13 modulo 10 check digit algorithm."""
 
@@ -70,27 +105,33 @@ class TestCheckDigit:
         """999999999999: sum = 6*9 + 6*27 = 54+162 = 216, check = 4."""
         assert calculate_ean13_check_digit("999999999999") == 4
 
-    def test_wrong_length_short_raises(self):
-        with pytest.raises(BarcodeError):
-            calculate_ean13_check_digit("00001010008")  # 11 digits
+    def test_matches_oracle(self):
+        """Cross-check ~1000 inputs spread across the 12-digit space."""
+        for n in range(0, 10**12, 999_999_937):
+            digits = f"{n:012d}"
+            assert calculate_ean13_check_digit(digits) == _oracle_check_digit(digits)
 
-    def test_wrong_length_long_raises(self):
+    @pytest.mark.parametrize("digits", CHECK_DIGIT_ERRORS)
+    def test_invalid_input_raises(self, digits):
         with pytest.raises(BarcodeError):
-            calculate_ean13_check_digit("0000101000850")  # 13 digits
-
-    def test_non_digit_raises(self):
-        with pytest.raises(BarcodeError):
-            calculate_ean13_check_digit("00001010008A")
-
-    def test_empty_raises(self):
-        with pytest.raises(BarcodeError):
-            calculate_ean13_check_digit("")
+            calculate_ean13_check_digit(digits)
 
 
 # ---------------------------------------------------------------------------
 # SKU validation
 # ---------------------------------------------------------------------------
 
+SKU_ERRORS = [
+    "123456",                # six digits
+    "ABC00",                 # non-numeric
+    "POR175",                # pork SKUs are not numeric
+    "",
+    "-1",
+    "\uff11\uff10\uff10",  # full-width digits pass str.isdigit()
+    "1\u00b2",               # superscript two passes str.isdigit()
+]
+
+
 class TestValidateSku:
 
     def test_five_digit_sku(self):
@@ -108,105 +149,93 @@ class TestValidateSku:
     def test_max_sku(self):
         assert validate_sku("99999") == "99999"
 
-    def test_six_digit_raises(self):
-        with pytest.raises(BarcodeError):
-            validate_sku("123456")
-
-    def test_non_numeric_raises(self):
-        with pytest.raises(BarcodeError):
-            validate_sku("ABC00")
-
-    def test_pork_sku_raises(self):
-        """Pork SKUs like POR175 are not numeric and should fail."""
-        with pytest.raises(BarcodeError):
-            validate_sku("POR175")
-
-    def test_empty_raises(self):
-        with pytest.raises(BarcodeError):
-            validate_sku("")
-
-    def test_negative_raises(self):
+    @pytest.mark.parametrize("sku", SKU_ERRORS)
+    def test_invalid_sku_raises(self, sku):
         with pytest.raises(BarcodeError):
-            validate_sku("-1")
+            validate_sku(sku)
 
 
 # ---------------------------------------------------------------------------
 # Weight encoding
 # ---------------------------------------------------------------------------
 
-class TestEncodeWeight:
-
-    def test_prd_example_1_52(self):
-        assert encode_weight(1.52) == "00152"
-
-    def test_prd_example_12_5(self):
-        assert encode_weight(12.5) == "01250"
-
-    def test_prd_example_0_75(self):
-        assert encode_weight(0.75) == "00075"
-
-    def test_processor_ny_strip_0_85(self):
-        assert encode_weight(0.85) == "00085"
-
-    def test_processor_flat_iron_1_49(self):
-        assert encode_weight(1.49) == "00149"
-
-    def test_minimum_weight(self):
-        assert encode_weight(0.01) == "00001"
-
-    def test_maximum_weight(self):
-        assert encode_weight(999.99) == "99999"
-
-    def test_one_pound(self):
-        assert encode_weight(1.0) == "00100"
-
-    def test_ten_pounds(self):
-        assert encode_weight(10.0) == "01000"
-
-    def test_fifteen_pounds_scale_max(self):
-        """15 lb is the scale max capacity."""
-        assert encode_weight(15.0) == "01500"
-
-    def test_rounding_sub_hundredth(self):
-        """0.005 lb = 0.5 hundredths, rounds to 0 (banker's rounding). Below minimum."""
-        with pytest.raises(BarcodeError):
-            encode_weight(0.005)
-
-    def test_rounding_half(self):
-        """1.525 should round to 153 (banker's rounding to even)."""
-        result = encode_weight(1.525)
-        # Python rounds 152.5 to 152 (round half to even)
-        assert result == "00152"
+# (weight_lb, expected) pairs. Python's round() is half-to-even, and some
+# decimal weights sit just below the half in IEEE 754.
+ENCODE_CASES = [
+    (1.52, "00152"),    # PRD example
+    (12.5, "01250"),    # PRD example
+    (0.75, "00075"),    # PRD example
+    (0.85, "00085"),    # processor NY Strip
+    (1.49, "00149"),    # processor Flat Iron
+    (0.01, "00001"),    # minimum weight
+    (999.99, "99999"),  # maximum weight
+    (1.0, "00100"),
+    (10.0, "01000"),
+    (15.0, "01500"),    # scale max capacity
+    (1.525, "00152"),   # 152.5 rounds to 152 (half to even)
+    (1.524, "00152"),   # rounds down
+    (0.015, "00002"),   # scale resolution: 1.5 rounds to 2 (even)
+    (0.02, "00002"),
+    (1.005, "00100"),   # 100.5 rounds to 100 (even)
+    (1.015, "00101"),   # 1.015 * 100 = 101.49999... in IEEE 754
+]
+
+ENCODE_ERRORS = [
+    0.005,    # 0.5 hundredths rounds to 0, below minimum
+    0.0,
+    -1.0,
+    1000.0,
+    999.999,  # rounds to 100000, exceeds 5 digits
+]
+
+
+# Decimal and str weights round exactly, with no IEEE 754 representation error
+ENCODE_DECIMAL_CASES = [
+    ("1.52", "00152"),
+    (Decimal("1.52"), "00152"),
+    ("15", "01500"),
+    ("999.99", "99999"),
+    ("1.525", "00152"),  # 152.5 rounds to 152 (half to even)
+    ("1.535", "00154"),  # 153.5 rounds to 154 (half to even)
+    ("0.015", "00002"),  # 1.5 rounds to 2 (even)
+    ("1.005", "00100"),  # 100.5 rounds to 100 (even)
+    ("1.015", "00102"),  # exactly 101.5, unlike the float 1.015
+    (Decimal("1.015"), "00102"),
+]
+
+ENCODE_DECIMAL_ERRORS = [
+    "0.005",    # 0.5 hundredths rounds to 0, below minimum
+    "0",
+    "-1",
+    "1000",
+    "999.995",  # rounds to 100000, exceeds 5 digits
+    "1e30",     # large exponent
+    "",
+    "abc",
+    "NaN",
+    Decimal("Infinity"),
+]
 
-    def test_rounding_down(self):
-        assert encode_weight(1.524) == "00152"
 
-    def test_zero_raises(self):
-        with pytest.raises(BarcodeError):
-            encode_weight(0.0)
+class TestEncodeWeight:
 
-    def test_negative_raises(self):
-        with pytest.raises(BarcodeError):
-            encode_weight(-1.0)
+    @pytest.mark.parametrize("weight,expected", ENCODE_CASES)
+    def test_encode(self, weight, expected):
+        assert encode_weight(weight) == expected
 
-    def test_too_heavy_raises(self):
+    @pytest.mark.parametrize("weight", ENCODE_ERRORS)
+    def test_out_of_range_raises(self, weight):
         with pytest.raises(BarcodeError):
-            encode_weight(1000.0)
+            encode_weight(weight)
 
-    def test_barely_too_heavy(self):
-        with pytest.raises(BarcodeError):
-            encode_weight(999.999)  # rounds to 100000, exceeds 5 digits
+    @pytest.mark.parametrize("weight,expected", ENCODE_DECIMAL_CASES)
+    def test_encode_decimal(self, weight, expected):
+        assert encode_weight(weight) == expected
 
-    def test_weight_resolution_005(self):
-        """Scale resolution is 0.005 lb. Verify encoding at resolution boundaries."""
+    @pytest.mark.parametrize("weight", ENCODE_DECIMAL_ERRORS)
+    def test_invalid_decimal_raises(self, weight):
         with pytest.raises(BarcodeError):
-            encode_weight(0.005)
-        assert encode_weight(0.01) == "00001"
-        assert encode_weight(0.015) == "00002"  # rounds to 2 (even)
-        assert encode_weight(0.02) == "00002"
-        assert encode_weight(1.005) == "00100"  # 100.5 rounds to 100 (even)
-        # 1.015 * 100 = 101.49999... in IEEE 754, rounds to 101
-        assert encode_weight(1.015) == "00101"
+            encode_weight(weight)
 
 
 # ---------------------------------------------------------------------------
@@ -270,6 +299,20 @@ class TestGenerateBarcode:
         with pytest.raises(BarcodeError):
             generate_barcode("00100", 0.0)
 
+    def test_decimal_barcode_round_trip(self):
+        barcode = generate_barcode("00101", Decimal("0.85"))
+        assert barcode == "0000101000855"
+        parsed = parse_barcode(barcode)
+        assert parsed["sku"] == "000101"
+        assert parsed["weight_encoded"] == "00085"
+
+    def test_str_weight_barcode(self, caplog):
+        """A str weight flows through generate_barcode and its debug log."""
+        with caplog.at_level(logging.DEBUG, logger="src.barcode"):
+            barcode = generate_barcode("00125", "1.49")
+        assert barcode == "0000125001494"
+        assert "weight=1.49 lb" in caplog.text
+
 
 # ---------------------------------------------------------------------------
 # Box barcode generation
@@ -296,6 +339,18 @@ class TestGenerateBoxBarcode:
         expected = calculate_ean13_check_digit(barcode[:12])
         assert int(barcode[12]) == expected
 
+    def test_summed_float_weight_logged_to_hundredths(self, caplog):
+        """A float box total with rounding noise still logs as 2 decimals."""
+        with caplog.at_level(logging.DEBUG, logger="src.barcode"):
+            generate_box_barcode("00101", 3, 1.0 + 1.0 + 1.0000000000000004)
+        assert "weight=3.00 lb" in caplog.text
+
+    def test_str_weight_box_barcode(self, caplog):
+        with caplog.at_level(logging.DEBUG, logger="src.barcode"):
+            barcode = generate_box_barcode("00101", 5, "4.25")
+        assert barcode[7:12] == "00425"
+        assert "weight=4.25 lb" in caplog.text
+
 
 # ---------------------------------------------------------------------------
 # Barcode parsing
@@ -325,6 +380,16 @@ class TestParseBarcode:
         assert parsed["weight_lb"] == 1.49
         assert parsed["check_digit"] == 4
 
+    def test_round_trip_sweep(self):
+        """Every hundredth over the scale range, plus a stride to 999.99 lb."""
+        hundredths = list(range(1, 1501)) + list(range(1501, 100000, 997))
+        for i, n in enumerate(hundredths):
+            sku = f"{(i * 7919) % 100000:05d}"
+            parsed = parse_barcode(generate_barcode(sku, n / 100))
+            assert parsed["sku"] == sku.zfill(6)
+            assert parsed["weight_encoded"] == f"{n:05d}"
+            assert parsed["weight_lb"] == n / 100
+
     def test_invalid_check_digit(self):
         """Manually corrupt the check digit."""
         barcode = generate_barcode("00100", 1.52)
@@ -344,6 +409,10 @@ class TestParseBarcode:
         with pytest.raises(BarcodeError):
             parse_barcode("000010100085X")
 
+    def test_parse_non_ascii_digits(self):
+        with pytest.raises(BarcodeError):
+            parse_barcode("\uff10" * 13)
+
     def test_weight_extraction(self):
         barcode = generate_barcode("00100", 12.5)
         parsed = parse_barcode(barcode)
@@ -359,57 +428,64 @@ class TestParseBarcode:
 # All active beef SKUs
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def load_beef_skus():
-    """Load all active beef SKUs from the CSV."""
+    """Load all active beef SKUs from the CSV.
+
+    Returns (sku, expected_barcode_sku) pairs, where the expected value
+    is the SKU zero-padded to the 6-digit barcode field.
+    """
     csv_path = os.path.join(
         os.path.dirname(__file__), "..", "data", "pomponio_skus.csv"
     )
-    skus = []
+    # Read the whole file in one call, then tokenize from memory
     with open(csv_path, newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row["active"].strip().lower() == "true" and row["sku"].isdigit():
-                skus.append(row["sku"])
-    return skus
+        text = f.read()
+
+    reader = csv.reader(text.splitlines())
+    header = next(reader)
+    sku_idx = header.index("sku")
+    active_idx = header.index("active")
+    return tuple(
+        (row[sku_idx], row[sku_idx].zfill(6))
+        for row in reader
+        if row[active_idx].strip().lower() == "true"
+        and row[sku_idx].isdigit()
+    )
 
 
 BEEF_SKUS = load_beef_skus()
 
+# (weight_lb, weight field): 1 lb, typical retail cut, round-trip check, heavy cut
+BEEF_WEIGHTS = (
+    (1.0, "00100"),
+    (1.52, "00152"),
+    (3.33, "00333"),
+    (8.75, "00875"),
+)
+BEEF_CASES = [
+    (sku, expected_sku, weight, weight_field)
+    for sku, expected_sku in BEEF_SKUS
+    for weight, weight_field in BEEF_WEIGHTS
+]
+BEEF_CASE_IDS = [f"{sku}-{weight}" for sku, _, weight, _ in BEEF_CASES]
+
 
 class TestAllBeefSkus:
     """Generate barcodes for every active beef SKU at multiple weights."""
 
-    @pytest.mark.parametrize("sku", BEEF_SKUS)
-    def test_barcode_generation_1lb(self, sku):
-        barcode = generate_barcode(sku, 1.0)
-        assert len(barcode) == 13
-        assert barcode.isdigit()
-        assert barcode[0] == "0"
-        parsed = parse_barcode(barcode)
-        assert parsed["sku"] == sku.zfill(5).zfill(6)
-
-    @pytest.mark.parametrize("sku", BEEF_SKUS)
-    def test_barcode_generation_typical_weight(self, sku):
-        """Typical retail cut weight: 1.52 lbs."""
-        barcode = generate_barcode(sku, 1.52)
-        parsed = parse_barcode(barcode)
-        assert parsed["weight_lb"] == 1.52
-
-    @pytest.mark.parametrize("sku", BEEF_SKUS)
-    def test_barcode_generation_heavy(self, sku):
-        """Heavy cut: 8.75 lbs."""
-        barcode = generate_barcode(sku, 8.75)
-        parsed = parse_barcode(barcode)
-        assert parsed["weight_lb"] == 8.75
-
-    @pytest.mark.parametrize("sku", BEEF_SKUS)
-    def test_barcode_round_trip(self, sku):
+    @pytest.mark.parametrize(
+        "sku,expected_sku,weight,weight_field", BEEF_CASES, ids=BEEF_CASE_IDS
+    )
+    def test_barcode_round_trip(self, sku, expected_sku, weight, weight_field):
         """Full round-trip: generate then parse, verify all fields."""
-        weight = 3.33
         barcode = generate_barcode(sku, weight)
-        parsed = parse_barcode(barcode)
-        assert parsed["sku"] == sku.zfill(5).zfill(6)
-        assert parsed["weight_lb"] == 3.33
+        assert len(barcode) == 13
+        assert barcode[0] == "0"
+        assert barcode[1:7] == expected_sku
+        assert barcode[7:12] == weight_field
+        # Parsing validates the check digit
+        assert parse_barcode(barcode)["weight_encoded"] == weight_field
 
     def test_beef_sku_count(self):
         """Verify we loaded the expected number of active numeric SKUs from CSV."""
@@ -431,16 +507,16 @@ class TestEdgeCases:
             assert parsed["weight_lb"] == round(w * 100) / 100
 
     def test_every_check_digit_value(self):
-        """Ensure we can produce barcodes with each check digit 0-9."""
-        seen_checks = set()
-        for sku_num in range(100, 200):
-            for weight_hundredths in range(1, 50):
-                barcode = generate_barcode(str(sku_num), weight_hundredths / 100.0)
-                seen_checks.add(int(barcode[12]))
-                if len(seen_checks) == 10:
-                    break
-            if len(seen_checks) == 10:
-                break
+        """Ensure we can produce barcodes with each check digit 0-9.
+
+        SKU 00100 at 0.10-0.19 lb varies only the last data digit, which
+        carries weight 3. Since 3*d mod 10 is a bijection, these ten
+        barcodes cover every check digit.
+        """
+        seen_checks = {
+            int(generate_barcode("00100", hundredths / 100.0)[12])
+            for hundredths in range(10, 20)
+        }
         assert seen_checks == {0, 1, 2, 3, 4, 5, 6, 7, 8, 9}
 
     def test_barcode_uniqueness_different_weights(self):
@@ -461,6 +537,33 @@ class TestEdgeCases:
         encoded = encode_weight(weight)
         assert encoded == "00030"
 
+    def test_accumulated_scale_steps_no_float_drift(self):
+        """Summing 0.005 lb scale steps encodes every whole hundredth exactly.
+
+        Only even step counts land on a whole hundredth. On odd counts the
+        exact total is a half-hundredth tie, and the drifted float total
+        falls on either side of it, so the float encoding there does not
+        match exact half-to-even rounding and is not asserted.
+        """
+        weight = 0.0
+        for steps in range(1, 3001):
+            weight += 0.005
+            if steps % 2:
+                continue
+            encoded = encode_weight(weight)
+            assert encoded == f"{steps // 2:05d}"
+            parsed = parse_barcode(generate_barcode("00100", weight))
+            assert parsed["weight_encoded"] == encoded
+
+    @pytest.mark.parametrize("package_weight", [0.85, 1.49, 1.52, 3.33])
+    def test_box_total_no_float_drift(self, package_weight):
+        """A box total summed package by package encodes exactly."""
+        hundredths = round(package_weight * 100)
+        total = 0.0
+        for count in range(1, 61):
+            total += package_weight
+            assert encode_weight(total) == f"{hundredths * count:05d}"
+
     def test_sku_leading_zeros_preserved(self):
         barcode = generate_barcode("00001", 1.0)
         assert barcode[1:7] == "000001"